@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Diff two versions of a case dataset (e.g. hydra_graph_data.json vs. the enriched
+hydra_graph_data (1).json) by node and relationship key, and emit a compact delta
+patch that the viewer or a Neo4j load can apply instead of re-ingesting the graph.
+
+Usage:
+    python3 scripts/diff_case_versions.py OLD.json NEW.json            # JSON patch on stdout
+    python3 scripts/diff_case_versions.py OLD.json NEW.json --cypher   # Cypher delta on stdout
+"""
+import json, sys, hashlib
+
+# ── Keys that identify an entry; everything else is a diffable attribute ──
+NODE_KEY = ('id',)
+REL_KEY = ('source_id', 'relationship_type', 'target_id')
+
+def entry_key(entry, fields):
+    """Stable key for a node or relationship ('a|TYPE|b' for relationships)."""
+    return '|'.join(str(entry.get(f, '')) for f in fields)
+
+def digest(entry):
+    """Content hash of an entry, independent of key order."""
+    return hashlib.sha1(json.dumps(entry, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+def diff_attrs(old, new, key_fields):
+    """Return {'set': {...}, 'unset': [...]} for changed attributes, key fields excluded."""
+    changed = {k: v for k, v in new.items() if k not in key_fields and old.get(k) != v}
+    removed = sorted(k for k in old if k not in key_fields and k not in new)
+    delta = {}
+    if changed:
+        delta['set'] = changed
+    if removed:
+        delta['unset'] = removed
+    return delta
+
+def diff_entries(old_entries, new_entries, key_fields):
+    """
+    Single hashed pass over the new version: each new entry is looked up by key in an
+    index of the old version and popped; whatever remains in the index was removed.
+    Attribute-level diffing only runs when the content hashes differ.
+    """
+    index = {entry_key(e, key_fields): e for e in old_entries}
+    added, changed = [], {}
+    for entry in new_entries:
+        key = entry_key(entry, key_fields)
+        old = index.pop(key, None)
+        if old is None:
+            added.append(entry)
+        elif digest(old) != digest(entry):
+            delta = diff_attrs(old, entry, key_fields)
+            if delta:
+                changed[key] = delta
+    removed = [{f: e.get(f) for f in key_fields} for e in index.values()]
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+def diff_case(old, new):
+    """Build the delta patch between two case datasets."""
+    patch = {
+        'from': old.get('metadata', {}).get('generated', ''),
+        'to': new.get('metadata', {}).get('generated', ''),
+        'nodes': diff_entries(old.get('nodes', []), new.get('nodes', []), NODE_KEY),
+        'relationships': diff_entries(old.get('relationships', []), new.get('relationships', []), REL_KEY),
+    }
+    meta = diff_attrs(old.get('metadata', {}), new.get('metadata', {}), ())
+    if meta:
+        patch['metadata'] = meta
+    return patch
+
+def summary(patch):
+    """One-line human-readable summary for stderr."""
+    parts = []
+    for section in ('nodes', 'relationships'):
+        d = patch[section]
+        parts.append(f"{section}: +{len(d['added'])} -{len(d['removed'])} ~{len(d['changed'])}")
+    return ' | '.join(parts)
+
+# ── Cypher output (matches the MERGE/SET style of input/hydra_neo4j_import.cypher) ──
+
+def cy_val(v):
+    """Format a value as a Cypher literal."""
+    if isinstance(v, list):
+        return '[' + ', '.join(cy_val(x) for x in v) + ']'
+    if isinstance(v, bool):
+        return 'true' if v else 'false'
+    if isinstance(v, (int, float)):
+        return str(v)
+    return json.dumps(str(v), ensure_ascii=False)
+
+def cy_map(props):
+    """Format a property dict as a Cypher map literal; nested dicts are stored as JSON strings."""
+    items = []
+    for k, v in props.items():
+        if isinstance(v, dict):
+            v = json.dumps(v, ensure_ascii=False)
+        items.append(f"{k}: {cy_val(v)}")
+    return '{' + ', '.join(items) + '}'
+
+def cy_rel_match(rel):
+    return (f"MATCH (a {{id: {cy_val(rel['source_id'])}}})"
+            f"-[r:{rel['relationship_type']}]->(b {{id: {cy_val(rel['target_id'])}}})")
+
+def to_cypher(patch):
+    """Render the patch as Cypher statements for an incremental Neo4j load."""
+    out = [f"// === DELTA {patch['from']} → {patch['to']} ===", ""]
+    nodes, rels = patch['nodes'], patch['relationships']
+
+    out.append("// === REMOVED RELATIONSHIPS ===")
+    for rel in rels['removed']:
+        out.append(f"{cy_rel_match(rel)} DELETE r;")
+    out.append("")
+    out.append("// === REMOVED NODES ===")
+    for node in nodes['removed']:
+        out.append(f"MATCH (n {{id: {cy_val(node['id'])}}}) DETACH DELETE n;")
+    out.append("")
+    out.append("// === ADDED NODES ===")
+    for node in nodes['added']:
+        label = node.get('type', 'Entity')
+        props = {k: v for k, v in node.items() if k not in ('id', 'type')}
+        out.append(f"MERGE (n:{label} {{id: {cy_val(node['id'])}}}) SET n += {cy_map(props)};")
+    out.append("")
+    out.append("// === CHANGED NODES ===")
+    for nid, delta in nodes['changed'].items():
+        stmt = f"MATCH (n {{id: {cy_val(nid)}}})"
+        if 'set' in delta:
+            stmt += f" SET n += {cy_map(delta['set'])}"
+        if 'unset' in delta:
+            stmt += ' REMOVE ' + ', '.join(f"n.{k}" for k in delta['unset'])
+        out.append(stmt + ';')
+    out.append("")
+    out.append("// === ADDED RELATIONSHIPS ===")
+    for rel in rels['added']:
+        props = {k: v for k, v in rel.items() if k not in REL_KEY}
+        stmt = (f"MATCH (a {{id: {cy_val(rel['source_id'])}}}), (b {{id: {cy_val(rel['target_id'])}}}) "
+                f"MERGE (a)-[r:{rel['relationship_type']}]->(b)")
+        if props:
+            stmt += f" SET r += {cy_map(props)}"
+        out.append(stmt + ';')
+    out.append("")
+    out.append("// === CHANGED RELATIONSHIPS ===")
+    for key, delta in rels['changed'].items():
+        src, rtype, tgt = key.split('|')
+        stmt = cy_rel_match({'source_id': src, 'relationship_type': rtype, 'target_id': tgt})
+        if 'set' in delta:
+            stmt += f" SET r += {cy_map(delta['set'])}"
+        if 'unset' in delta:
+            stmt += ' REMOVE ' + ', '.join(f"r.{k}" for k in delta['unset'])
+        out.append(stmt + ';')
+    return '\n'.join(out)
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if len(args) != 2:
+        sys.exit(__doc__)
+    with open(args[0]) as f:
+        old = json.load(f)
+    with open(args[1]) as f:
+        new = json.load(f)
+
+    patch = diff_case(old, new)
+    print(summary(patch), file=sys.stderr)
+    if '--cypher' in sys.argv:
+        print(to_cypher(patch))
+    else:
+        print(json.dumps(patch, ensure_ascii=False, separators=(',', ':')))